@@ -1,15 +1,46 @@
+import os
+
 from . import topquadrant_shacl
 __version__ = "0.3.4a2"
 __all__ = ["topquadrant_shacl"]
 
 
 def check_java_installed():
+    import shutil
     import subprocess
     import sys
+    from pathlib import Path
+
+    java = shutil.which("java")
+    if java is None:
+        sys.exit("Java is not installed. Please install Java to use this package.")
+    # remember a successful check so later imports do not have to fork a JVM;
+    # the marker is keyed on the java binary so an upgrade re-runs the check.
+    # An empty XDG_CACHE_HOME means the default, and if no cache directory can
+    # be worked out at all the check simply runs every time
     try:
-        subprocess.run(["java", "-version"], check=True, capture_output=True)
+        cache_dir = Path(
+            os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache")
+        )
+        marker = cache_dir / "brick_tq_shacl" / f"java_ok_{os.stat(java).st_mtime_ns}"
+        if not marker.is_absolute():
+            marker = None
+        elif marker.exists():
+            return
+    except (RuntimeError, OSError):
+        marker = None
+    try:
+        subprocess.run([java, "-version"], check=True, capture_output=True)
     except (subprocess.CalledProcessError, FileNotFoundError):
         sys.exit("Java is not installed. Please install Java to use this package.")
+    if marker is None:
+        return
+    try:
+        marker.parent.mkdir(parents=True, exist_ok=True)
+        marker.touch()
+    except OSError:
+        pass
 
 
-check_java_installed()
+if not os.environ.get("BRICK_TQ_SHACL_SKIP_JAVA_CHECK"):
+    check_java_installed()
@@ -1,16 +1,27 @@
+import hashlib
+import os
 import subprocess
 import platform
 import tempfile
 import rdflib
-from rdflib import OWL, SH
+from rdflib import OWL, SH, XSD, Literal
+from rdflib.plugins.serializers.nt import _nt_row
+from rdflib.store import Store
 from rdflib.term import BNode, URIRef, _SKOLEM_DEFAULT_AUTHORITY, rdflib_skolem_genid
+from collections import OrderedDict
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Tuple
 from urllib.parse import urljoin
 import logging
 
 logger = logging.getLogger(__name__)
 
+# skolemize runs once per blank node, so the default prefix is joined once here
+# instead of parsing the authority URL on every call
+_SKOLEM_PREFIX = urljoin(_SKOLEM_DEFAULT_AUTHORITY, rdflib_skolem_genid)
+_SPACE_TO_UNDERSCORE = str.maketrans({" ": "_"})
+
+
 # monkeypatch BNode.skolemize with a new function
 def _new_bnode_skolemize(
     self, authority: Optional[str] = None, basepath: Optional[str] = None
@@ -20,181 +31,401 @@ def _new_bnode_skolemize(
 
     .. versionadded:: 4.0
     """
+    if authority is None and basepath is None:
+        return URIRef(f"{_SKOLEM_PREFIX}{str.translate(self, _SPACE_TO_UNDERSCORE)}")
     if authority is None:
         authority = _SKOLEM_DEFAULT_AUTHORITY
     if basepath is None:
         basepath = rdflib_skolem_genid
-    skolem = "%s%s" % (basepath, str(self).replace(" ", "_"))
+    skolem = "%s%s" % (basepath, str.translate(self, _SPACE_TO_UNDERSCORE))
     return URIRef(urljoin(authority, skolem))
 
 
 BNode.skolemize = _new_bnode_skolemize
 _MAX_EXTERNAL_LOOPS = 10
+# the SHACL tools run in a fresh, short-lived JVM for every call; C1-only JIT
+# and the serial collector cut its startup and warmup time considerably. Set
+# JVM_ARGS in the environment to override
+_DEFAULT_JVM_ARGS = "-XX:TieredStopAtLevel=1 -XX:+UseSerialGC"
+# SHACL_HOME points to the bundled shacl-1.4.2 directory so that the scripts in
+# its bin/ can find the shacl.jar file. If using *nix, use .sh; else if on
+# windows use .bat
+_SHACL_HOME = Path(__file__).parent / "topquadrant_shacl"
+_SHACL_HOME_ENV = {"SHACL_HOME": str(_SHACL_HOME)}
+if platform.system() == "Windows":
+    _INFER_SCRIPT = [str(_SHACL_HOME / "bin/shaclinfer.bat")]
+    _VALIDATE_SCRIPT = [str(_SHACL_HOME / "bin/shaclvalidate.bat")]
+else:
+    _INFER_SCRIPT = ["/bin/sh", str(_SHACL_HOME / "bin/shaclinfer.sh")]
+    _VALIDATE_SCRIPT = ["/bin/sh", str(_SHACL_HOME / "bin/shaclvalidate.sh")]
+# triples inferred per (data graph, ontologies, max_iterations) digest; only
+# used when BRICK_TQ_SHACL_CACHE is set
+_INFER_CACHE_SIZE = 16
+_INFER_CACHE: "OrderedDict[tuple, tuple]" = OrderedDict()
+# N-Triples bytes of recently used ontologies, keyed by their digest; also only
+# used when BRICK_TQ_SHACL_CACHE is set
+_ONTOLOGY_NT_CACHE_SIZE = 4
+_ONTOLOGY_NT_CACHE: "OrderedDict[bytes, bytes]" = OrderedDict()
+
+# attribute access on rdflib's DefinedNamespace builds a new URIRef every
+# time, so terms used per triple or per report are looked up once here
+_XSD_STRING = XSD.string
+_VIOLATION_PATTERN = (None, SH.resultSeverity, SH.Violation)
+_CONFORMS_PATTERN = (None, SH.conforms, Literal(True))
+_REPORT_PATTERN = (None, SH.conforms, None)
+_RULE_PATTERN = (None, SH.rule, None)
+# sh:values is SHACL-AF and not part of rdflib's closed SH namespace
+_VALUES_PATTERN = (None, URIRef(str(SH) + "values"), None)
+
+# parse the inferred triples with oxrdflib's native Turtle parser if it is
+# installed; rdflib's pure-Python parser is the fallback
+try:
+    rdflib.plugin.get("ox-turtle", rdflib.parser.Parser)
+    _INFERRED_FORMAT = "ox-turtle"
+except rdflib.plugin.PluginException:
+    _INFERRED_FORMAT = "turtle"
+
+
+def _run_shacl_tool(script, args, env, output_path: Path) -> Tuple[int, str]:
+    """Run one of the TopQuadrant SHACL scripts with its stdout going straight
+    into ``output_path``. The tools log to stderr (see log4j2.properties), so
+    stdout is nothing but RDF and never passes through Python. Returns the
+    tool's exit code and whatever it wrote to stderr."""
+    logging.debug(f"Running {script} {' '.join(map(str, args))}")
+    with open(output_path, "wb") as out, tempfile.TemporaryFile("w+") as err:
+        # stderr goes to a file so the tool can never block on a full pipe
+        proc = subprocess.run(
+            [*script, *args],
+            stdout=out,
+            stderr=err,
+            check=False,
+            env=env,
+        )
+        err.seek(0)
+        return proc.returncode, err.read()
+
+
+class _TripleSink(Store):
+    """Bare-bones rdflib store that hands each triple a parser produces to
+    ``callback`` instead of indexing it, so the tool output can be filtered
+    without first building a Graph out of it."""
+
+    def __init__(self, callback):
+        super().__init__()
+        self.callback = callback
+
+    def add(self, triple, context, quoted=False):
+        self.callback(triple)
+
+    def addN(self, quads):
+        callback = self.callback
+        for s, p, o, _ in quads:
+            callback((s, p, o))
+
+
+def _write_skolemized_nt(triples, f, skolems: dict) -> None:
+    """Write ``triples`` (a graph or any iterable of triples) to the binary
+    file ``f`` as N-Triples with every blank node replaced by its skolem IRI.
+    ``skolems`` maps BNode -> URIRef and is filled in as new blank nodes are
+    seen, so repeated calls reuse the same IRIs without building a skolemized
+    copy of the graph."""
+    write = f.write
+    for s, p, o in triples:
+        if isinstance(s, BNode):
+            s = skolems.get(s) or skolems.setdefault(s, s.skolemize())
+        if isinstance(o, BNode):
+            o = skolems.get(o) or skolems.setdefault(o, o.skolemize())
+        write(_nt_row((s, p, o)).encode("utf-8"))
 
 
 def infer(
-    data_graph: rdflib.Graph, ontologies: rdflib.Graph, max_iterations: int = 100
+    data_graph: rdflib.Graph,
+    ontologies: rdflib.Graph,
+    max_iterations: int = 100,
+    store: str = "default",
 ):
+    # Create a temporary directory
+    with tempfile.TemporaryDirectory() as temp_dir:
+        expanded_graph, _ = _infer_with_tempdir(
+            data_graph, ontologies, Path(temp_dir), max_iterations, store
+        )
+        return expanded_graph
+
+
+def _pop_imports(graph: rdflib.Graph) -> tuple:
+    """Remove the owl:imports triples from ``graph`` and return them so they
+    can be added back later. The pattern is matched once; each removal is then
+    a direct lookup of a fully bound triple."""
+    imports = tuple(graph.triples((None, OWL.imports, None)))
+    for triple in imports:
+        graph.remove(triple)
+    return imports
+
+
+def _has_shacl_rules(graph: rdflib.Graph) -> bool:
+    """True if ``graph`` holds anything shaclinfer would execute: sh:rule or
+    sh:values (the only inputs to TopQuadrant's RuleEngine)."""
+    return _RULE_PATTERN in graph or _VALUES_PATTERN in graph
+
+
+def _graph_digest(graph: rdflib.Graph) -> bytes:
+    """Order-independent digest of the triples in ``graph``: the sum of the
+    blake2b hashes of their N-Triples rows. Blank nodes are hashed by label,
+    so cached inferences about them are only ever replayed onto the very
+    same blank nodes."""
+    total = 0
+    for triple in graph:
+        digest = hashlib.blake2b(_nt_row(triple).encode("utf-8"), digest_size=32)
+        total += int.from_bytes(digest.digest(), "big")
+    return (total % (1 << 256)).to_bytes(32, "big")
+
+
+def _serialized_ontologies(ontologies: rdflib.Graph, digest: bytes) -> bytes:
+    """N-Triples serialization of ``ontologies``, reused across calls for
+    ontologies with the same ``digest``."""
+    data = _ONTOLOGY_NT_CACHE.get(digest)
+    if data is not None:
+        _ONTOLOGY_NT_CACHE.move_to_end(digest)
+        return data
+    data = ontologies.serialize(format="nt", encoding="utf-8")
+    _ONTOLOGY_NT_CACHE[digest] = data
+    while len(_ONTOLOGY_NT_CACHE) > _ONTOLOGY_NT_CACHE_SIZE:
+        _ONTOLOGY_NT_CACHE.popitem(last=False)
+    return data
+
+
+def _infer_rounds(
+    graph: rdflib.Graph,
+    target_file_path: Path,
+    skolems: dict,
+    max_iterations: int,
+) -> Tuple[list, bool]:
+    """Run shaclinfer over ``target_file_path`` until it stops producing new
+    triples, adding them to ``graph`` and appending them to the file as it
+    goes. Returns every triple that was added, and whether the last round
+    found nothing new (rather than hitting ``_MAX_EXTERNAL_LOOPS``)."""
+    temp_dir_path = target_file_path.parent
+    bnodes = {iri: bnode for bnode, iri in skolems.items()}
+
+    env = {
+        **_SHACL_HOME_ENV,
+        "JVM_ARGS": os.environ.get("JVM_ARGS", _DEFAULT_JVM_ARGS),
+    }
+
+    added_triples = []
+    converged = False
+    current_iter = 0
+
+    # Run the shaclinfer multiple times until it stops producing new triples
+    while current_iter < _MAX_EXTERNAL_LOOPS:
+        inferred_file_path = temp_dir_path / "inferred.ttl"
+        returncode, stderr = _run_shacl_tool(
+            _INFER_SCRIPT,
+            ["-datafile", target_file_path, "-maxiterations", str(max_iterations)],
+            env,
+            inferred_file_path,
+        )
+        # a failing rule makes shaclinfer exit non-zero with empty output,
+        # which would otherwise look like a round that found nothing new
+        if returncode != 0:
+            raise Exception(f"SHACL inference process exited with code {returncode}\n{stderr}")
+        # only keep the triples we do not already have, mapping skolem
+        # IRIs back to the original blank nodes. Triples are filtered as the
+        # parser produces them rather than collected into a Graph first
+        new_triples = []
+
+        def _collect(triple):
+            s, p, o = triple
+            # blank nodes minted by the tool have no counterpart in the data
+            if isinstance(s, BNode) or isinstance(o, BNode):
+                return
+            # oxrdflib types simple literals as xsd:string, which rdflib does
+            # not consider equal to the plain literals in the data graph
+            if type(o) is Literal and o.datatype == _XSD_STRING:
+                o = Literal(str(o))
+            # a data graph without blank nodes has nothing to map back
+            triple = (bnodes.get(s, s), p, bnodes.get(o, o)) if bnodes else (s, p, o)
+            if triple not in graph:
+                new_triples.append(triple)
+
+        try:
+            rdflib.Graph(store=_TripleSink(_collect)).parse(
+                inferred_file_path, format=_INFERRED_FORMAT
+            )
+            logging.debug(f"Got {len(new_triples)} new inferred triples")
+        except Exception as e:
+            raise Exception(f"Error parsing inferred triples: {e}\nMaybe due to SHACL inference process exception?\n{stderr}")
+        current_iter += 1
+        if not new_triples:
+            converged = True
+            break
+        graph.addN((s, p, o, graph) for s, p, o in new_triples)
+        added_triples.extend(new_triples)
+        # inferred triples only ever refer to blank nodes already in the data
+        # graph, so the skolem IRIs (and ``bnodes``) stay valid
+        with open(target_file_path, "ab") as f:
+            _write_skolemized_nt(new_triples, f, skolems)
+    return added_triples, converged
+
+
+def _infer_with_tempdir(
+    data_graph: rdflib.Graph,
+    ontologies: rdflib.Graph,
+    temp_dir_path: Path,
+    max_iterations: int = 100,
+    store: str = "default",
+) -> Tuple[rdflib.Graph, Path]:
+    """Run the inference loop using files in ``temp_dir_path``. Returns the
+    expanded graph and the N-Triples file holding it together with the
+    ontologies (minus owl:imports), ready to be handed to shaclvalidate."""
     # remove imports
-    imports = list(data_graph.triples((None, OWL.imports, None)))
-    data_graph.remove((None, OWL.imports, None))
+    imports = _pop_imports(data_graph)
     # remove imports from ontologies too
-    ontology_imports = ontologies.remove((None, OWL.imports, None))
+    ontology_imports = _pop_imports(ontologies)
 
-    # skolemize before inference
-    data_graph_skolemized = data_graph
+    # with BRICK_TQ_SHACL_CACHE set, remember which triples were inferred for
+    # a given data graph and set of ontologies and replay them on a repeat call
+    cache_key = None
+    cached_triples = None
+    if os.environ.get("BRICK_TQ_SHACL_CACHE"):
+        ontologies_digest = _graph_digest(ontologies)
+        cache_key = (_graph_digest(data_graph), ontologies_digest, max_iterations)
+        cached_triples = _INFER_CACHE.get(cache_key)
+        if cached_triples is not None:
+            _INFER_CACHE.move_to_end(cache_key)
 
-    # Create a temporary directory
-    with tempfile.TemporaryDirectory() as temp_dir:
-        temp_dir_path = Path(temp_dir)
+    # skolemize before inference. If another rdflib store is requested (e.g.
+    # "Oxigraph", from oxrdflib via the "oxigraph" extra), run the loop
+    # against a copy of the data graph held in that store and copy the new
+    # triples back at the end
+    if store == "default":
+        data_graph_skolemized = data_graph
+    else:
+        data_graph_skolemized = rdflib.Graph(store=store)
+        data_graph_skolemized += data_graph
 
-        # Define the target path within the temporary directory
-        target_file_path = temp_dir_path / "data.ttl"
-        (data_graph_skolemized + ontologies).serialize(
-            target_file_path, format="turtle"
-        )
-        # add imports back
-        for imp in ontology_imports:
-            ontologies.add(imp)
-
-        # set the SHACL_HOME environment variable to point to the shacl-1.4.2 directory
-        # so that the shaclinfer.sh script can find the shacl.jar file
-        env = {"SHACL_HOME": str(Path(__file__).parent / "topquadrant_shacl")}
-        # get the shacl-1.4.2/bin/shaclinfer.sh script from brickschema.bin in this package
-        # using pkgutil. If using *nix, use .sh; else if on windows use .bat
-        if platform.system() == "Windows":
-            script = [
-                str(Path(__file__).parent / "topquadrant_shacl/bin/shaclinfer.bat")
-            ]
+    # Define the target path within the temporary directory. N-Triples is
+    # line-oriented and much cheaper for rdflib to write than Turtle; the
+    # TopQuadrant tool picks the input syntax from the file extension
+    target_file_path = temp_dir_path / "data.nt"
+
+    # blank nodes in the data graph are written out as skolem IRIs so that
+    # inferences about them survive the round trip through the tool
+    skolems = {}
+    # the ontologies never change and the data graph only grows, so write both
+    # once here; each round then appends just its new triples to the file
+    with open(target_file_path, "wb") as f:
+        if cache_key is not None:
+            # the digest is already paid for, so reuse earlier serializations
+            f.write(_serialized_ontologies(ontologies, ontologies_digest))
         else:
-            script = [
-                "/bin/sh",
-                str(Path(__file__).parent / "topquadrant_shacl/bin/shaclinfer.sh"),
-            ]
-
-        # Initialize the size of the graph
-        previous_size = 0
-        current_size = len(data_graph_skolemized)
-        current_iter = 0
-
-        # Run the shaclinfer multiple times until the skolemized data graph stops changing in size
-        while previous_size != current_size and current_iter < _MAX_EXTERNAL_LOOPS:
-            (data_graph_skolemized + ontologies).serialize(
-                target_file_path, format="turtle"
+            ontologies.serialize(f, format="nt", encoding="utf-8")
+        _write_skolemized_nt(data_graph_skolemized, f, skolems)
+    # add imports back
+    ontologies.addN((s, p, o, ontologies) for s, p, o in ontology_imports)
+
+    # a cache hit never records anything, so its value here does not matter
+    converged = True
+    if cached_triples is not None:
+        added_triples = cached_triples
+        data_graph_skolemized.addN(
+            (s, p, o, data_graph_skolemized) for s, p, o in added_triples
+        )
+        with open(target_file_path, "ab") as f:
+            _write_skolemized_nt(added_triples, f, skolems)
+    elif not _has_shacl_rules(ontologies) and not _has_shacl_rules(data_graph):
+        # no rules anywhere, so running shaclinfer could not add anything
+        added_triples = []
+    else:
+        added_triples, converged = _infer_rounds(
+            data_graph_skolemized, target_file_path, skolems, max_iterations
+        )
+
+    expanded_graph = data_graph
+    if data_graph_skolemized is not data_graph:
+        expanded_graph.addN((s, p, o, expanded_graph) for s, p, o in added_triples)
+
+    if cache_key is not None and cached_triples is None:
+        _INFER_CACHE[cache_key] = tuple(added_triples)
+        # only when the rounds ran out of new triples is the expanded graph a
+        # fixpoint that inferring over again cannot add to; after hitting
+        # _MAX_EXTERNAL_LOOPS a repeat call must be allowed to keep going
+        if converged:
+            expanded_key = (
+                _graph_digest(expanded_graph), ontologies_digest, max_iterations
             )
-            try:
-                logging.debug(f"Running {script} -datafile {target_file_path}")
-                proc = subprocess.run(
-                    [
-                        *script,
-                        "-datafile",
-                        target_file_path,
-                        "-maxiterations",
-                        str(max_iterations),
-                    ],
-                    capture_output=True,
-                    universal_newlines=True,
-                    check=False,
-                    env=env,
-                )
-            except subprocess.CalledProcessError as e:
-                raise Exception(f"Error running shaclinfer: {e.output}")
-            # Write logs to a file in the temporary directory (or the desired location)
-            inferred_file_path = temp_dir_path / "inferred.ttl"
-            with open(inferred_file_path, "w") as f:
-                for line in proc.stdout.splitlines():
-                    if "::" not in line:
-                        f.write(f"{line}\n")
-            try:
-                inferred_triples = rdflib.Graph()
-                inferred_triples.parse(inferred_file_path, format="turtle")
-                logging.debug(f"Got {len(inferred_triples)} inferred triples")
-            except Exception as e:
-                raise Exception(f"Error parsing inferred triples: {e}\nMaybe due to SHACL inference process exception?\n{proc.stderr}")
-            for s, p, o in inferred_triples:
-                if isinstance(s, BNode) or isinstance(o, BNode):
-                    continue
-                data_graph_skolemized.add((s, p, o))
-
-            # Update the size of the graph
-            previous_size = current_size
-            current_size = len(data_graph_skolemized)
-            current_iter += 1
-
-        expanded_graph = data_graph_skolemized
-        # add imports back in
-        for imp in imports:
-            expanded_graph.add(imp)
-        return expanded_graph
+            _INFER_CACHE[expanded_key] = ()
+        while len(_INFER_CACHE) > _INFER_CACHE_SIZE:
+            _INFER_CACHE.popitem(last=False)
+
+    # add imports back in
+    expanded_graph.addN((s, p, o, expanded_graph) for s, p, o in imports)
+    return expanded_graph, target_file_path
 
 
-def validate(data_graph: rdflib.Graph, shape_graphs: rdflib.Graph):
+def validate(
+    data_graph: rdflib.Graph,
+    shape_graphs: rdflib.Graph,
+    store: str = "default",
+    pre_infer: bool = True,
+):
+    # ``store`` only selects where the inference loop runs, so it means
+    # nothing without pre_infer; reject it rather than silently ignore it
+    if not pre_infer and store != "default":
+        raise ValueError("store only applies when pre_infer=True")
     # remove imports
-    data_graph.remove((None, OWL.imports, None))
+    _pop_imports(data_graph)
 
-    # set the SHACL_HOME environment variable to point to the shacl-1.4.2 directory
-    # so that the shaclinfer.sh script can find the shacl.jar file
-    env = {"SHACL_HOME": str(Path(__file__).parent / "topquadrant_shacl")}
+    env = {
+        **_SHACL_HOME_ENV,
+        "JVM_ARGS": os.environ.get("JVM_ARGS", _DEFAULT_JVM_ARGS),
+    }
     # Create a temporary directory
     with tempfile.TemporaryDirectory() as temp_dir:
         temp_dir_path = Path(temp_dir)
 
-        # Define the target path within the temporary directory
-        target_file_path = temp_dir_path / "data.ttl"
-
-        inferred_graph = infer(data_graph, shape_graphs)
-
-        # combine the inferred graph with the shape graphs
-        (inferred_graph + shape_graphs).serialize(target_file_path, format="ttl")
-
-        # get the shacl-1.4.2/bin/shaclvalidate.sh script from the same directory
-        # as this file
-        if platform.system() == "Windows":
-            script = [
-                str(Path(__file__).parent / "topquadrant_shacl/bin/shaclvalidate.bat")
-            ]
-        else:
-            script = [
-                "/bin/sh",
-                str(Path(__file__).parent / "topquadrant_shacl/bin/shaclvalidate.sh"),
-            ]
-        try:
-            logging.debug(f"Running {script} -datafile {target_file_path}")
-            proc = subprocess.run(
-                [
-                    *script,
-                    "-datafile",
-                    target_file_path,
-                    "-maxiterations",
-                    "100",
-                ],
-                capture_output=True,
-                universal_newlines=True,
-                check=False,
-                env=env,
+        if pre_infer:
+            # the last file written by the inference loop already holds the
+            # inferred graph combined with the shape graphs, so validate that
+            # directly instead of serializing everything again
+            _, target_file_path = _infer_with_tempdir(
+                data_graph, shape_graphs, temp_dir_path, store=store
             )
-        except subprocess.CalledProcessError as e:
-            raise Exception(f"Error running shaclinfer: {e.output}")
+        else:
+            # shaclvalidate does not execute sh:rule, so only skip the
+            # inference loop if data_graph has already been through infer()
+            target_file_path = temp_dir_path / "data.nt"
+            shape_imports = _pop_imports(shape_graphs)
+            with open(target_file_path, "wb") as f:
+                shape_graphs.serialize(f, format="nt", encoding="utf-8")
+                _write_skolemized_nt(data_graph, f, {})
+            shape_graphs.addN((s, p, o, shape_graphs) for s, p, o in shape_imports)
 
-        # Write logs to a file in the temporary directory (or the desired location)
         report_file_path = temp_dir_path / "report.ttl"
-        with open(report_file_path, "w") as f:
-            for line in proc.stdout.splitlines():
-                if "::" not in line:  # filter out log output
-                    f.write(f"{line}\n")
+        returncode, stderr = _run_shacl_tool(
+            _VALIDATE_SCRIPT,
+            ["-datafile", target_file_path, "-maxiterations", "100"],
+            env,
+            report_file_path,
+        )
         try:
             report_g = rdflib.Graph()
             report_g.parse(report_file_path, format="turtle")
         except Exception as e:
-            raise Exception(f"Error parsing report: {e}\nMaybe due to SHACL validation process exception?\n{proc.stderr}")
+            raise Exception(f"Error parsing report: {e}\nMaybe due to SHACL validation process exception?\n{stderr}")
+        # shaclvalidate also exits with 1 when the data does not conform, so
+        # only a non-zero exit without a report to show for it is a failure
+        if returncode != 0 and _REPORT_PATTERN not in report_g:
+            raise Exception(f"SHACL validation process exited with code {returncode}\n{stderr}")
 
-        # check if there are any sh:resultSeverity sh:Violation predicate/object pairs
-        has_violation = len(
-            list(report_g.subjects(predicate=SH.resultSeverity, object=SH.Violation))
-        )
-        conforms = len(
-            list(report_g.subjects(predicate=SH.conforms, object=rdflib.Literal(True)))
+        # the graph validates if the report says it conforms or, failing that, if
+        # no result has sh:Violation severity (warnings alone do not fail it).
+        # Graph.__contains__ stops at the first match, and a conforming report
+        # never needs the second probe
+        validates = (
+            _CONFORMS_PATTERN in report_g or _VIOLATION_PATTERN not in report_g
         )
-        validates = not has_violation or conforms
 
-        return validates, report_g, str(report_g.serialize(format="turtle"))
+        # the tool already wrote the report as Turtle; hand that text back
+        # rather than serializing report_g all over again
+        return validates, report_g, report_file_path.read_text(encoding="utf-8")